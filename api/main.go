@@ -16,6 +16,10 @@ import (
 	"pre_trading/services/utils"
 )
 
+// healthResponse is the constant /health body, encoded once so liveness
+// probes skip the per-request map allocation and JSON encoding.
+var healthResponse = []byte(`{"status":"healthy"}` + "\n")
+
 // APIGateway handles HTTP and WebSocket requests
 type APIGateway struct {
 	router      *mux.Router
@@ -105,7 +109,8 @@ func NewAPIGateway(eventBus *eventbus.EventBus) *APIGateway {
 func (gw *APIGateway) setupRoutes() {
 	// Health check (must be before PathPrefix)
 	gw.router.HandleFunc("/health", func(w http.ResponseWriter, r *http.Request) {
-		json.NewEncoder(w).Encode(map[string]string{"status": "healthy"})
+		w.Header().Set("Content-Type", "application/json")
+		w.Write(healthResponse)
 	}).Methods("GET")
 
 	// WebSocket route
@@ -69,6 +69,7 @@ type HmacSha256 = Hmac<sha2::Sha256>;
 const INTERNAL_AUTH_MAX_SKEW_SECONDS: i64 = 30;
 
 static INTERNAL_AUTH_SHARED_SECRET: OnceLock<String> = OnceLock::new();
+static INTERNAL_AUTH_MAC: OnceLock<HmacSha256> = OnceLock::new();
 
 #[derive(Debug, Clone, serde::Serialize, serde::Deserialize)]
 struct FundingRateRecord {
@@ -33,6 +33,20 @@ fn internal_auth_secret() -> Result<&'static str, Rejection> {
         })
 }
 
+// Derive the keyed HMAC state once; each request clones it instead of re-padding the secret.
+fn internal_auth_mac() -> Result<HmacSha256, Rejection> {
+    if let Some(mac) = INTERNAL_AUTH_MAC.get() {
+        return Ok(mac.clone());
+    }
+    let mac = HmacSha256::new_from_slice(internal_auth_secret()?.as_bytes()).map_err(|_| {
+        reject_api(
+            StatusCode::INTERNAL_SERVER_ERROR,
+            "internal auth init failed",
+        )
+    })?;
+    Ok(INTERNAL_AUTH_MAC.get_or_init(|| mac).clone())
+}
+
 #[allow(clippy::too_many_arguments)]
 fn internal_auth_payload(
     method: &Method,
@@ -109,12 +123,7 @@ fn verify_internal_principal(
     );
     let signature_bytes = hex::decode(signature)
         .map_err(|_| reject_api(StatusCode::UNAUTHORIZED, "invalid internal auth signature"))?;
-    let mut mac = HmacSha256::new_from_slice(internal_auth_secret()?.as_bytes()).map_err(|_| {
-        reject_api(
-            StatusCode::INTERNAL_SERVER_ERROR,
-            "internal auth init failed",
-        )
-    })?;
+    let mut mac = internal_auth_mac()?;
     mac.update(payload.as_bytes());
     mac.verify_slice(&signature_bytes).map_err(|_| {
         reject_api(